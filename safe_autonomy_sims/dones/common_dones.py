@@ -20,7 +20,8 @@ import numpy as np
 from corl.dones.done_func_base import DoneFuncBase, DoneFuncBaseValidator, DoneStatusCodes, SharedDoneFuncBase, SharedDoneFuncBaseValidator
 from corl.libraries.environment_dict import DoneDict
 from corl.libraries.state_dict import StateDict
-from corl.simulators.common_platform_utils import get_platform_by_name
+
+from safe_autonomy_sims.utils import any_collision
 
 
 class TimeoutDoneValidator(DoneFuncBaseValidator):
@@ -90,11 +91,8 @@ class TimeoutDoneFunction(DoneFuncBase):
             the done condition for the current agent.
         """
 
-        # get sim time
-        platform = get_platform_by_name(next_state, self.config.platform_name)
-        sim_time = platform.sim_time
-
-        done = sim_time >= self.config.max_sim_time
+        # sim time is simulator-wide, so read it from the state rather than looking up the platform
+        done = next_state.sim_time >= self.config.max_sim_time
 
         if done:
             next_state.episode_state[self.config.platform_name][self.name] = DoneStatusCodes.LOSE
@@ -175,43 +173,24 @@ class CollisionDoneFunction(SharedDoneFuncBase):
         """
 
         # get list of spacecrafts
-        platform_names = list(local_dones.keys())
-        try:
-            platform_names.remove("__all__")
-        except ValueError:
-            # TODO: remove try catch, if not necessary
-            # print(err)
-            pass
+        agent_names = list(local_dones.keys())
+        platform_names = [name for name in agent_names if name != "__all__"]
 
         # populate DoneDict
         done = DoneDict()
-        for name in local_dones.keys():
-            done[name] = False
-
-        # check if any platform violates boundaries of other platforms
-        while len(platform_names) > 1:
-            name = platform_names.pop()
-            platform = get_platform_by_name(next_state, name)
-            position = platform.position
-
-            for other_platform_name in platform_names:
-
-                if local_dones[other_platform_name]:
-                    # skip if other_agent is done
-                    continue
+        done.update(dict.fromkeys(agent_names, False))
 
-                # check location against location of other platforms for boundary violation
-                other_platform = get_platform_by_name(next_state, other_platform_name)
-                other_platform_position = other_platform.position
+        if len(platform_names) < 2:
+            return done
 
-                radial_distance = np.linalg.norm(np.array(position) - np.array(other_platform_position))
+        # check if any platform violates boundaries of other platforms
+        sim_platforms = next_state.sim_platforms
+        positions = np.array([sim_platforms[name].position for name in platform_names], dtype=np.float64)
+        skip = np.array([bool(local_dones[name]) for name in platform_names])
 
-                if radial_distance < self.config.safety_constraint:
-                    # collision detected. stop loop and end episode
-                    for k in local_dones.keys():
-                        done[k] = True
-                    # break
-                    return done
+        if any_collision(positions, skip, self.config.safety_constraint):
+            # collision detected. end episode
+            done.update(dict.fromkeys(agent_names, True))
         return done
 
 
@@ -289,24 +268,16 @@ class MultiagentSuccessDoneFunction(SharedDoneFuncBase):
             Dictionary containing the done condition for each agent.
         """
 
-        # populate DoneDict
+        # agents without a success function entry have not reached a done condition yet
+        success_function_name = self.config.success_function_name
+        all_succeeded = all(
+            next_state.episode_state[platform_name].get(success_function_name) == DoneStatusCodes.WIN
+            for platform_name in local_done_info.keys()
+        )
+
+        # populate DoneDict, all dones are True once every agent has succeeded
         done = DoneDict()
-        for name in local_dones.keys():
-            done[name] = False
-
-        for platform_name in local_done_info.keys():
-            if self.config.success_function_name in next_state.episode_state[platform_name]:
-                # docking kvp exists
-                if next_state.episode_state[platform_name][self.config.success_function_name] != DoneStatusCodes.WIN:
-                    # agent failed to reach WIN condition
-                    return done
-            else:
-                # agent has not reached done condition
-                return done
-
-        # all agents have succeeded, set all dones to True
-        for k in local_dones.keys():
-            done[k] = True
+        done.update(dict.fromkeys(local_dones.keys(), all_succeeded))
         return done
 
 
@@ -353,14 +324,10 @@ class SetAllDoneFunction(SharedDoneFuncBase):
             Dictionary containing the done condition for each agent.
         """
 
-        # get list of spacecrafts
-        platform_names = list(local_dones.keys())
         # populate DoneDict
         dones = DoneDict()
 
         done = any(local_dones.values())
-
-        for name in platform_names:
-            dones[name] = done
+        dones.update(dict.fromkeys(local_dones.keys(), done))
 
         return dones
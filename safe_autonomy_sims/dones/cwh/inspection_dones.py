@@ -20,7 +20,7 @@ from corl.dones.done_func_base import DoneFuncBase, DoneFuncBaseValidator, DoneS
 from corl.libraries.environment_dict import DoneDict
 from corl.libraries.state_dict import StateDict
 
-from safe_autonomy_sims.utils import get_closest_fft_distance
+from safe_autonomy_sims.utils import get_closest_fft_distance_sq_cached
 
 
 class SuccessfulInspectionDoneValidator(DoneFuncBaseValidator):
@@ -102,8 +102,7 @@ class SuccessfulInspectionDoneFunction(DoneFuncBase):
             weight = next_state.inspection_points_map[self.config.inspection_entity_name].get_total_weight_inspected()
             done_check = weight >= self.config.weight_threshold
         else:
-            inspection_points = next_state.inspection_points_map[self.config.inspection_entity_name]
-            done_check = all(inspection_points.points_inspected_dict.values())
+            done_check = next_state.inspection_points_map[self.config.inspection_entity_name].all_inspected
 
         done = bool(done_check)
         if done:
@@ -130,13 +129,11 @@ class SafeSuccessfulInspectionDoneValidator(SuccessfulInspectionDoneValidator):
     fft_time_step: float = 1
 
 
-class SafeSuccessfulInspectionDoneFunction(SuccessfulInspectionDoneFunction):
+class FFTSuccessfulInspectionDoneFunction(SuccessfulInspectionDoneFunction):
     """
-    A done function that determines if the deputy has successfully
-    inspected the chief.
-
-    Considers if a Free Flight Trajectory once the episode ends
-    **would not** result in a collision.
+    Base class for done functions that determine if the deputy has
+    successfully inspected the chief and then check the Free Flight
+    Trajectory (FFT) once the episode ends.
 
     Attributes
     ----------
@@ -147,6 +144,13 @@ class SafeSuccessfulInspectionDoneFunction(SuccessfulInspectionDoneFunction):
     def __init__(self, **kwargs) -> None:
         self.config: SafeSuccessfulInspectionDoneValidator
         super().__init__(**kwargs)
+        # FFT time horizon and trig terms depend only on config, so compute them once
+        self._fft_times = np.arange(0, 2 * np.pi / self.config.mean_motion, self.config.fft_time_step)
+        self._fft_sin_nt = np.sin(self.config.mean_motion * self._fft_times)
+        self._fft_cos_nt = np.cos(self.config.mean_motion * self._fft_times)
+        # scratch buffer for the [pos, vel] state, only read within __call__
+        self._fft_state = np.empty(6)
+        self._crash_region_radius_sq = self.config.crash_region_radius**2
 
     @staticmethod
     def get_validator():
@@ -157,9 +161,45 @@ class SafeSuccessfulInspectionDoneFunction(SuccessfulInspectionDoneFunction):
         Returns
         -------
         SafeSuccessfulInspectionDoneValidator
-            Config validator for the SafeSuccessfulInspectionDoneFunction."""
+            Config validator for the FFTSuccessfulInspectionDoneFunction.
+        """
         return SafeSuccessfulInspectionDoneValidator
 
+    def _closest_fft_distance_sq(self, platform) -> float:
+        """
+        Get the squared closest FFT distance to the origin from the platform's current state.
+
+        Parameters
+        ----------
+        platform : BasePlatform
+            platform whose trajectory is propagated
+
+        Returns
+        -------
+        float
+            Squared closest relative distance to the origin achieved during the FFT
+        """
+        self._fft_state[:3] = platform.position
+        self._fft_state[3:] = platform.velocity
+        return get_closest_fft_distance_sq_cached(
+            self._fft_state, self.config.mean_motion, self._fft_times, self._fft_sin_nt, self._fft_cos_nt
+        )
+
+
+class SafeSuccessfulInspectionDoneFunction(FFTSuccessfulInspectionDoneFunction):
+    """
+    A done function that determines if the deputy has successfully
+    inspected the chief.
+
+    Considers if a Free Flight Trajectory once the episode ends
+    **would not** result in a collision.
+
+    Attributes
+    ----------
+    config: SafeSuccessfulInspectionDoneValidator
+        The function's validated configuration parameters
+    """
+
     def __call__(
         self,
         observation: OrderedDict,
@@ -193,23 +233,20 @@ class SafeSuccessfulInspectionDoneFunction(SuccessfulInspectionDoneFunction):
 
         done = super().__call__(observation, action, next_observation, next_state, observation_space, observation_units)
 
-        if done:
-            pos = next_state.sim_platforms[self.config.platform_name].position
-            vel = next_state.sim_platforms[self.config.platform_name].velocity
-            state = np.concatenate((pos, vel))
-            n = self.config.mean_motion
-            times = np.arange(0, 2 * np.pi / n, self.config.fft_time_step)
-            dist = get_closest_fft_distance(state, self.config.mean_motion, times)
-            if dist >= self.config.crash_region_radius:
-                next_state.episode_state[self.config.platform_name][self.name] = DoneStatusCodes.WIN
-            else:
-                # TODO: why is done set to False if deputy is within crash radius? Would crash not end episode?
-                done = False
+        if not done:
+            return done
+
+        platform_name = self.config.platform_name
+        if self._closest_fft_distance_sq(next_state.sim_platforms[platform_name]) >= self._crash_region_radius_sq:
+            next_state.episode_state[platform_name][self.name] = DoneStatusCodes.WIN
+        else:
+            # TODO: why is done set to False if deputy is within crash radius? Would crash not end episode?
+            done = False
 
         return done
 
 
-class CrashAfterSuccessfulInspectionDoneFunction(SuccessfulInspectionDoneFunction):
+class CrashAfterSuccessfulInspectionDoneFunction(FFTSuccessfulInspectionDoneFunction):
     """
     A done function that determines if the deputy has successfully
     inspected the chief.
@@ -223,23 +260,6 @@ class CrashAfterSuccessfulInspectionDoneFunction(SuccessfulInspectionDoneFunctio
         The function's validated configuration parameters
     """
 
-    def __init__(self, **kwargs) -> None:
-        self.config: SafeSuccessfulInspectionDoneValidator
-        super().__init__(**kwargs)
-
-    @staticmethod
-    def get_validator():
-        """
-        Returns configuration validator object for this done
-        function.
-
-        Returns
-        -------
-        SafeSuccessfulInspectionDoneValidator
-            Config validator for the CrashAfterSuccessfulInspectionDoneFunction.
-        """
-        return SafeSuccessfulInspectionDoneValidator
-
     def __call__(
         self,
         observation: OrderedDict,
@@ -273,17 +293,14 @@ class CrashAfterSuccessfulInspectionDoneFunction(SuccessfulInspectionDoneFunctio
 
         done = super().__call__(observation, action, next_observation, next_state, observation_space, observation_units)
 
-        if done:
-            pos = next_state.sim_platforms[self.config.platform_name].position
-            vel = next_state.sim_platforms[self.config.platform_name].velocity
-            state = np.concatenate((pos, vel))
-            n = self.config.mean_motion
-            times = np.arange(0, 2 * np.pi / n, self.config.fft_time_step)
-            dist = get_closest_fft_distance(state, self.config.mean_motion, times)
-            if dist < self.config.crash_region_radius:
-                next_state.episode_state[self.config.platform_name][self.name] = DoneStatusCodes.LOSE
-            else:
-                done = False
+        if not done:
+            return done
+
+        platform_name = self.config.platform_name
+        if self._closest_fft_distance_sq(next_state.sim_platforms[platform_name]) < self._crash_region_radius_sq:
+            next_state.episode_state[platform_name][self.name] = DoneStatusCodes.LOSE
+        else:
+            done = False
 
         return done
 
@@ -366,11 +383,9 @@ class MultiagentSuccessfulInspectionDoneFunction(SharedDoneFuncBase):
             weight = next_state.inspection_points_map[self.config.inspection_entity_name].get_total_weight_inspected()
             done_check = weight >= self.config.weight_threshold
         else:
-            inspection_points = next_state.inspection_points_map[self.config.inspection_entity_name]
-            done_check = all(inspection_points.points_inspected_dict.values())
+            done_check = next_state.inspection_points_map[self.config.inspection_entity_name].all_inspected
 
         if done_check:
-            for k in local_dones.keys():
-                done[k] = True
+            done.update(dict.fromkeys(local_dones.keys(), True))
 
         return done
@@ -14,6 +14,7 @@ vector and the unit vector pointing from the deputy to the chief.
 
 Author: Kochise Bennett
 """
+import math
 import typing
 from collections import OrderedDict
 from functools import cached_property
@@ -54,6 +55,13 @@ class DotProductGlue(BaseMultiWrapperGlue):
         return DotProductGlueValidator
 
     def get_unique_name(self) -> str:
+        return self._unique_name
+
+    @cached_property
+    def _unique_name(self) -> str:
+        """
+        The wrapped glues are fixed after construction, so the name only needs to be built once
+        """
         glue_name0 = self.glues()[0].get_unique_name()
         glue_name1 = self.glues()[1].get_unique_name()
         return glue_name0 + "_DotProduct_" + glue_name1
@@ -83,12 +91,17 @@ class DotProductGlue(BaseMultiWrapperGlue):
         obs0 = glue0.get_observation(other_obs, obs_space, obs_units)[glue0.Fields.DIRECT_OBSERVATION].m
         obs1 = glue1.get_observation(other_obs, obs_space, obs_units)[glue1.Fields.DIRECT_OBSERVATION].m
 
-        dot_product = np.dot(obs0, obs1)
+        obs0 = np.asarray(obs0, dtype=np.float64)
+        obs1 = np.asarray(obs1, dtype=np.float64)
+
+        # plain scalar math avoids the per-call numpy dispatch overhead of norm/clip on 3-vectors
+        dot_product = float(obs0 @ obs1)
 
         if self.config.normalize_vectors:
-            dot_product = dot_product / (np.linalg.norm(obs0) * np.linalg.norm(obs1) + 1e-5)
+            norm_product = math.sqrt(float(obs0 @ obs0) * float(obs1 @ obs1))
+            dot_product = dot_product / (norm_product + 1e-5)
 
-            dot_product = np.clip(dot_product, -1.0, 1.0)
+            dot_product = max(-1.0, min(1.0, dot_product))
 
         d = OrderedDict()
         d[self.Fields.DIRECT_OBSERVATION] = corl_get_ureg().Quantity(np.array([dot_product], dtype=np.float32), "dimensionless")
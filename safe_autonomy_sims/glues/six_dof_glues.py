@@ -11,6 +11,7 @@ limitation or restriction. See accompanying README and LICENSE for details.
 
 This module implements glues for the six-dof environments
 """
+import math
 import typing
 from collections import OrderedDict
 from functools import cached_property
@@ -22,7 +23,8 @@ from corl.glues.base_wrapper import BaseWrapperGlue
 from corl.libraries.property import BoxProp, DictProp
 from corl.libraries.units import corl_get_ureg
 from pydantic import validator
-from scipy.spatial.transform import Rotation
+
+from safe_autonomy_sims.utils import rotate_by_quaternion
 
 
 class MagNorm3DGlue(BaseWrapperGlue):
@@ -146,15 +148,18 @@ class RotateVectorToLocalRef3d(BaseMultiWrapperGlue):
                                                               obs_units)[orientation_wrapped.Fields.DIRECT_OBSERVATION]
         input_vector = input_vector_wrapped.get_observation(other_obs, obs_space, obs_units)[input_vector_wrapped.Fields.DIRECT_OBSERVATION]
 
+        # build the scalar-last quaternion directly rather than a scipy Rotation
         if self.config.mode == 'euler':
-            orientation = Rotation.from_euler('z', angles=orientation_obs.m[0])
+            half_angle = 0.5 * float(orientation_obs.m[0])
+            quaternion = np.array([0.0, 0.0, math.sin(half_angle), math.cos(half_angle)])
         elif self.config.mode == 'quaternion':
-            orientation = Rotation.from_quat(orientation_obs.m)
+            quaternion = np.array(orientation_obs.m, dtype=np.float64)
 
         if self.config.apply_inv:
-            rotated_vector = orientation.inv().apply(input_vector.m).astype(np.float32)
-        else:
-            rotated_vector = orientation.apply(input_vector.m).astype(np.float32)
+            # inverse rotation is the conjugate quaternion
+            quaternion[:3] = -quaternion[:3]
+
+        rotated_vector = rotate_by_quaternion(quaternion, np.asarray(input_vector.m, dtype=np.float64)).astype(np.float32)
 
         d = OrderedDict()
         d[self.Fields.DIRECT_OBSERVATION] = corl_get_ureg().Quantity(rotated_vector, "dimensionless")
@@ -107,10 +107,11 @@ class RateController(CommonController):
         self.parent_platform.save_action_to_platform(action=control, axis=self.config.axis)
 
     def get_applied_control(self) -> np.ndarray:
-        return corl_get_ureg().Quantity(
-            np.array([self.parent_platform.get_applied_action().m[self.config.axis]], dtype=np.float32), self.unit
-        )
+        axis = self.config.axis
+        # slice keeps the action's float32 dtype, copy so the result does not alias the platform's action buffer
+        applied_control = self.parent_platform.get_applied_action().m[axis:axis + 1].copy()
+        return corl_get_ureg().Quantity(applied_control, self.unit)
 
 
-for sim in [CWHSimulator, InspectionSimulator]:
+for sim in (CWHSimulator, InspectionSimulator):
     PluginLibrary.AddClassToGroup(RateController, "RateController", {"simulator": sim, "platform_type": CWHAvailablePlatformTypes})
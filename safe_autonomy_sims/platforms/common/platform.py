@@ -13,6 +13,7 @@ This module implements a common platform object for the safe autonomy environmen
 """
 
 from corl.simulators.base_platform import BasePlatform
+from corl.simulators.common_platform_utils import get_sensor_by_name
 
 
 class BaseSafeRLPlatform(BasePlatform):
@@ -36,6 +37,8 @@ class BaseSafeRLPlatform(BasePlatform):
     def __init__(self, platform_name, platform, parts_list, sim_time=0.0):  # pylint: disable=W0613
         super().__init__(platform_name=platform_name, platform=platform, parts_list=parts_list)
         self._sim_time = sim_time
+        # sensor name -> sensor part, filled lazily by get_sensor
+        self._sensor_by_name = {}
 
     @property
     def sim_time(self):
@@ -52,3 +55,25 @@ class BaseSafeRLPlatform(BasePlatform):
     @sim_time.setter
     def sim_time(self, time):
         self._sim_time = time
+
+    def get_sensor(self, sensor_name):
+        """
+        Get a sensor part of this platform by name.
+
+        The parts list is only searched the first time a name is requested.
+
+        Parameters
+        ----------
+        sensor_name : str
+            Name of the sensor part.
+
+        Returns
+        -------
+        BaseSensor
+            The platform's sensor with the given name.
+        """
+        sensor = self._sensor_by_name.get(sensor_name)
+        if sensor is None:
+            sensor = get_sensor_by_name(self, sensor_name)
+            self._sensor_by_name[sensor_name] = sensor
+        return sensor
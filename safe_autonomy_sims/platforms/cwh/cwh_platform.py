@@ -85,10 +85,11 @@ class CWHPlatform(BaseSafeRLPlatform):
 
     def __eq__(self, other):
         if isinstance(other, CWHPlatform):
-            eq = (self.velocity == other.velocity).all()
-            eq = eq and (self.position == other.position).all()
-            eq = eq and self.sim_time == other.sim_time
-            return eq
+            # compare as python lists to short-circuit without allocating numpy bool arrays
+            return (
+                self.sim_time == other.sim_time and self.position.tolist() == other.position.tolist()
+                and self.velocity.tolist() == other.velocity.tolist()
+            )
         return False
 
     def save_action_to_platform(self, action, axis):
@@ -102,15 +103,16 @@ class CWHPlatform(BaseSafeRLPlatform):
         axis: int
             The index of the action space where the action shall be saved.
         """
-        if isinstance(action.m, np.ndarray) and len(action.m) == 1:
+        magnitude = action.m
+        if isinstance(magnitude, np.ndarray) and len(magnitude) == 1:
             # TODO: is there a way to ensure quantity coming in is of correct units?
             #       currently, incoming action is 'dimensionless'.
             # action = action.to('newton')
-            self._last_applied_action.m[axis] = action.m[0]
+            self._last_applied_action.m[axis] = magnitude[0]
         else:
             raise TypeError(
                 f"Action saved to platform is of incompatible type:\
-                             expected Quantity with numpy.ndarray of length 1, but got {type(action.m)}"
+                             expected Quantity with numpy.ndarray of length 1, but got {type(magnitude)}"
             )
 
     @property
@@ -222,10 +224,11 @@ class CWHSixDOFPlatform(CWHPlatform):
 
     def __eq__(self, other):
         if isinstance(other, CWHSixDOFPlatform):
-            eq = (self.velocity == other.velocity).all()
-            eq = eq and (self.position == other.position).all()
-            eq = eq and self.sim_time == other.sim_time
-            return eq
+            # compare as python lists to short-circuit without allocating numpy bool arrays
+            return (
+                self.sim_time == other.sim_time and self.position.tolist() == other.position.tolist()
+                and self.velocity.tolist() == other.velocity.tolist()
+            )
         return False
 
     @property
@@ -405,7 +405,7 @@ class OriginPositionSensor(CWHSensor):
         list of floats
             Position of spacecraft.
         """
-        return corl_get_ureg().Quantity(np.array([0, 0, 0]), "meters")
+        return corl_get_ureg().Quantity(np.zeros(3), "meters")
 
 
 class EntityVelocitySensor(CWHSensor):
@@ -482,7 +482,7 @@ class BoolArraySensor(CWHSensor):
             bool_array = np.array([float(False)])
         else:
             inspection_points = state.inspection_points_map[self.config.inspection_entity_name]
-            bool_array = np.array([float(bool(a)) for a in inspection_points.points_inspected_dict.values()])
+            bool_array = inspection_points.points_inspected_mask.astype(np.float64)
             if len(bool_array) == 99:  # TODO: Remove hardcoded value
                 bool_array = np.concatenate((bool_array, np.zeros(1)))
 
@@ -593,43 +593,25 @@ class OrbitStabilitySensor(CWHSensor):
         return corl_get_ureg().Quantity(np.array([orbit_stability], dtype=np.float32), "dimensionless")
 
 
-for sim in [CWHSimulator, InspectionSimulator]:
-    for sensor, sensor_name in zip(
-        [
-            CWHSensor,
-            PositionSensor,
-            VelocitySensor,
-            RelativePositionSensor,
-            RelativeVelocitySensor,
-            InspectedPointsSensor,
-            SunAngleSensor,
-            SunVectorSensor,
-            UninspectedPointsSensor,
-            BoolArraySensor,
-            EntityPositionSensor,
-            EntityVelocitySensor,
-            OriginPositionSensor,
-            PriorityVectorSensor,
-            InspectedPointsScoreSensor,
-            OrbitStabilitySensor,
-        ],
-        [
-            "Sensor_Generic",
-            "Sensor_Position",
-            "Sensor_Velocity",
-            "Sensor_RelativePosition",
-            "Sensor_RelativeVelocity",
-            "Sensor_InspectedPoints",
-            "Sensor_SunAngle",
-            "Sensor_SunVector",
-            "Sensor_UninspectedPoints",
-            "Sensor_BoolArray",
-            "Sensor_EntityPosition",
-            "Sensor_EntityVelocity",
-            "Sensor_OriginPosition",
-            "Sensor_PriorityVector",
-            "Sensor_InspectedPointsScore",
-            "Sensor_OrbitStability"
-        ]
-    ):
+_SENSOR_REGISTRATIONS = (
+    ("Sensor_Generic", CWHSensor),
+    ("Sensor_Position", PositionSensor),
+    ("Sensor_Velocity", VelocitySensor),
+    ("Sensor_RelativePosition", RelativePositionSensor),
+    ("Sensor_RelativeVelocity", RelativeVelocitySensor),
+    ("Sensor_InspectedPoints", InspectedPointsSensor),
+    ("Sensor_SunAngle", SunAngleSensor),
+    ("Sensor_SunVector", SunVectorSensor),
+    ("Sensor_UninspectedPoints", UninspectedPointsSensor),
+    ("Sensor_BoolArray", BoolArraySensor),
+    ("Sensor_EntityPosition", EntityPositionSensor),
+    ("Sensor_EntityVelocity", EntityVelocitySensor),
+    ("Sensor_OriginPosition", OriginPositionSensor),
+    ("Sensor_PriorityVector", PriorityVectorSensor),
+    ("Sensor_InspectedPointsScore", InspectedPointsScoreSensor),
+    ("Sensor_OrbitStability", OrbitStabilitySensor),
+)
+
+for sensor_name, sensor in _SENSOR_REGISTRATIONS:
+    for sim in (CWHSimulator, InspectionSimulator):
         PluginLibrary.AddClassToGroup(sensor, sensor_name, {"simulator": sim, "platform_type": CWHAvailablePlatformTypes})
@@ -14,13 +14,13 @@ This module implements rotation sensor for use with the CWHSixDofPlatform
 import numpy as np
 from corl.libraries.plugin_library import PluginLibrary
 from corl.libraries.units import corl_get_ureg
-from scipy.spatial.transform import Rotation as R
 
 import safe_autonomy_sims.platforms.cwh.cwh_properties as cwh_props
 from safe_autonomy_sims.platforms.cwh.cwh_available_platforms import CWHAvailablePlatformTypes
 from safe_autonomy_sims.platforms.cwh.cwh_sensors import CWHSensor
 from safe_autonomy_sims.simulators.cwh_simulator import CWHSimulator
 from safe_autonomy_sims.simulators.inspection_simulator import InspectionSimulator
+from safe_autonomy_sims.utils import rotate_by_quaternion
 
 
 class QuaternionSensor(CWHSensor):
@@ -85,12 +85,11 @@ class OrientationUnitVectorSensor(CWHSensor):
             sensor.
         """
         initial_orientation = None
-        try:
-            initial_orientation = state.inspection_points_map['chief'].config.initial_sensor_unit_vec
-        except KeyError:
-            initial_orientation = np.array([0.0, 0.0, 0.0])
+        chief_points = state.inspection_points_map.get('chief')
+        if chief_points is not None:
+            initial_orientation = chief_points.config.initial_sensor_unit_vec
         if initial_orientation is None:
-            initial_orientation = np.array([0.0, 0.0, 0.0])
+            initial_orientation = (0.0, 0.0, 0.0)
 
         initial_orientation = corl_get_ureg().Quantity(np.array(initial_orientation, dtype=np.float32), "dimensionless")
         return initial_orientation
@@ -108,6 +107,9 @@ class RotatedAxesSensor(CWHSensor):
     after rotation.
     """
 
+    # y and z unit vectors of the initial coordinate frame
+    _axes = np.array([[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+
     def __init__(self, parent_platform, config, property_class=cwh_props.RotatedAxesProp):
         super().__init__(property_class=property_class, parent_platform=parent_platform, config=config)
 
@@ -122,19 +124,20 @@ class RotatedAxesSensor(CWHSensor):
             sensor.
         """
         quaternion = self.parent_platform.quaternion
-        r = R.from_quat(quaternion)
-        v1 = np.array([0.0, 1.0, 0.0])
-        v2 = np.array([0.0, 0.0, 1.0])
-
-        rot_v1 = r.apply(v1)
-        rot_v2 = r.apply(v2)
 
-        out = np.concatenate([rot_v1, rot_v2])
+        # rotate both axes at once, flattened to [v1_x, v1_y, v1_z, v2_x, v2_y, v2_z]
+        out = rotate_by_quaternion(quaternion, self._axes).ravel()
         out = corl_get_ureg().Quantity(np.array(out, dtype=np.float32), "dimensionless")
         return out
 
 
-for sim in [CWHSimulator, InspectionSimulator]:
-    for sensor, sensor_name in zip([QuaternionSensor, AngularVelocitySensor, OrientationUnitVectorSensor, RotatedAxesSensor],
-                                   ["Sensor_Quaternion", "Sensor_AngularVelocity", "Sensor_OrientationUnitVector", "Sensor_RotatedAxes"]):
+_SENSOR_REGISTRATIONS = (
+    ("Sensor_Quaternion", QuaternionSensor),
+    ("Sensor_AngularVelocity", AngularVelocitySensor),
+    ("Sensor_OrientationUnitVector", OrientationUnitVectorSensor),
+    ("Sensor_RotatedAxes", RotatedAxesSensor),
+)
+
+for sensor_name, sensor in _SENSOR_REGISTRATIONS:
+    for sim in (CWHSimulator, InspectionSimulator):
         PluginLibrary.AddClassToGroup(sensor, sensor_name, {"simulator": sim, "platform_type": CWHAvailablePlatformTypes})
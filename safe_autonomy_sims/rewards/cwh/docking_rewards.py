@@ -304,7 +304,7 @@ class DockingDeltaVReward(RewardFuncBase):
         """
         deputy = get_platform_by_name(state, self.config.platform_names[0])
         control_vec = deputy.get_applied_action()
-        d_v = np.sum(np.abs(control_vec.m)) / self.mass * self.step_size
+        d_v = sum(map(abs, control_vec.m.tolist())) / self.mass * self.step_size
         return d_v
 
     @staticmethod
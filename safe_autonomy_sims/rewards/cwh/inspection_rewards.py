@@ -70,9 +70,6 @@ class ObservedPointsReward(RewardFuncBase):
         reward = 0.0
 
         inspection_points = next_state.inspection_points_map[self.config.inspection_entity_name]
-        current_num_points_inspected = inspection_points.get_num_points_inspected()
-        num_new_points = current_num_points_inspected - self.previous_num_points_inspected
-        self.previous_num_points_inspected = current_num_points_inspected
 
         if self.config.weighted_priority:
             current_weight_inspected = inspection_points.get_total_weight_inspected()
@@ -80,6 +77,9 @@ class ObservedPointsReward(RewardFuncBase):
             self.previous_weight_inspected = current_weight_inspected
             reward = self.config.scale * new_weight
         else:
+            current_num_points_inspected = inspection_points.get_num_points_inspected()
+            num_new_points = current_num_points_inspected - self.previous_num_points_inspected
+            self.previous_num_points_inspected = current_num_points_inspected
             reward = self.config.scale * num_new_points
 
         return reward
@@ -118,7 +118,12 @@ class ChiefDistanceReward(RewardFuncBase):
     def __init__(self, **kwargs):
         self.config: ChiefDistanceRewardValidator
         super().__init__(**kwargs)
-        self.dist_prev = 0.
+        # distances are only compared, so track and compare their squares
+        self.dist_prev_sq = 0.
+        self._threshold_dist_sq = self.config.threshold_dist**2
+        self._max_dist_sq = self.config.max_dist**2
+        # scratch buffer for the relative position, only read within __call__
+        self._relative_position = np.empty(3)
 
     @staticmethod
     def get_validator():
@@ -138,17 +143,17 @@ class ChiefDistanceReward(RewardFuncBase):
         reward = 0.0
 
         platform = get_platform_by_name(next_state, self.config.platform_names[0])
-        relative_position = get_relative_position(platform, self.config.reference_position_sensor_name)
-        dist = np.linalg.norm(relative_position)
+        relative_position = get_relative_position(platform, self.config.reference_position_sensor_name, out=self._relative_position)
+        dist_sq = float(relative_position @ relative_position)
 
         # Soft constraint
-        if dist >= self.config.threshold_dist:
-            reward = -self.config.scale * (np.sign(dist - self.dist_prev))
+        if dist_sq >= self._threshold_dist_sq:
+            reward = -self.config.scale * ((dist_sq > self.dist_prev_sq) - (dist_sq < self.dist_prev_sq))
 
-        if dist >= self.config.max_dist:
+        if dist_sq >= self._max_dist_sq:
             reward = self.config.punishment_reward
 
-        self.dist_prev = dist
+        self.dist_prev_sq = dist_sq
         return reward
 
 
@@ -196,6 +201,14 @@ class InspectionDeltaVReward(RewardFuncBase):
         self.constant_scale = self.config.constant_scale
         self.scale = 0.0
 
+        # mode is fixed by the config, so select the delta-v scalar once
+        if self.mode == "scale":
+            self._delta_v_scalar = self.constant_scalar
+        elif self.mode == "linear_increasing":
+            self._delta_v_scalar = self.linear_scalar
+        else:
+            raise ValueError('mode must be either "scale" or "linear_increasing"')
+
     def delta_v(self, state):
         """
         Get change in agent's velocity from the current state.
@@ -212,9 +225,16 @@ class InspectionDeltaVReward(RewardFuncBase):
         """
         deputy = get_platform_by_name(state, self.config.platform_names[0])  # TODO: assuming 1:1 agent:platform
         control_vec = deputy.get_applied_action().m
-        d_v = np.sum(np.abs(control_vec)) / self.mass * self.step_size
+        # control vectors only have 3-6 elements, so a python sum avoids numpy ufunc dispatch
+        d_v = sum(map(abs, control_vec.tolist())) / self.mass * self.step_size
         return d_v
 
+    def constant_scalar(self, time):  # pylint: disable=unused-argument
+        """
+        Delta-v penalty is scaled by the current scale value
+        """
+        return self.scale
+
     def linear_scalar(self, time):
         """
         Delta-v penalty increases linearly with training iteration
@@ -241,13 +261,7 @@ class InspectionDeltaVReward(RewardFuncBase):
             self.scale = state.delta_v_scale
         else:
             self.scale = self.constant_scale
-        reward = 0.0
-        if self.mode == "scale":
-            reward = self.scale * self.delta_v(next_state) + self.bias
-        elif self.mode == "linear_increasing":
-            reward = self.linear_scalar(state.sim_time) * self.delta_v(next_state) + self.bias
-        else:
-            raise ValueError('mode must be either "scale" or "linear_increasing"')
+        reward = self._delta_v_scalar(state.sim_time) * self.delta_v(next_state) + self.bias
 
         return reward
 
@@ -304,9 +318,8 @@ class InspectionSuccessReward(RewardFuncBase):
 
         else:
             inspection_points = next_state.inspection_points_map[self.config.inspection_entity_name]
-            all_inspected = all(inspection_points.points_inspected_dict.values())
 
-            if all_inspected:
+            if inspection_points.all_inspected:
                 reward = self.config.scale
 
         return reward
@@ -400,6 +413,9 @@ class InspectionCrashReward(RewardFuncBase):
     def __init__(self, **kwargs) -> None:
         self.config: InspectionCrashRewardValidator
         super().__init__(**kwargs)
+        self._crash_region_radius_sq = self.config.crash_region_radius**2
+        # scratch buffer for the relative position, only read within __call__
+        self._relative_position = np.empty(3)
 
     @staticmethod
     def get_validator():
@@ -420,10 +436,10 @@ class InspectionCrashReward(RewardFuncBase):
 
         # Get relatative position + velocity between platform and docking region
         platform = get_platform_by_name(next_state, self.config.platform_names[0])
-        relative_position = get_relative_position(platform, self.config.reference_position_sensor_name)
-        distance = np.linalg.norm(relative_position)
+        relative_position = get_relative_position(platform, self.config.reference_position_sensor_name, out=self._relative_position)
+        distance_sq = float(relative_position @ relative_position)
 
-        in_crash_region = distance <= self.config.crash_region_radius
+        in_crash_region = distance_sq <= self._crash_region_radius_sq
 
         if in_crash_region:
             reward = self.config.scale
@@ -455,8 +471,11 @@ class MaxDistanceReward(RewardFuncBase):
     """
 
     def __init__(self, **kwargs) -> None:
-        self.config: InspectionCrashRewardValidator
+        self.config: MaxDistanceRewardValidator
         super().__init__(**kwargs)
+        self._max_distance_sq = self.config.max_distance**2
+        # scratch buffer for the relative position, only read within __call__
+        self._relative_position = np.empty(3)
 
     @staticmethod
     def get_validator():
@@ -477,10 +496,10 @@ class MaxDistanceReward(RewardFuncBase):
 
         # Get relatative position + velocity between platform and docking region
         platform = get_platform_by_name(next_state, self.config.platform_names[0])
-        relative_position = get_relative_position(platform, self.config.reference_position_sensor_name)
-        distance = np.linalg.norm(relative_position)
+        relative_position = get_relative_position(platform, self.config.reference_position_sensor_name, out=self._relative_position)
+        distance_sq = float(relative_position @ relative_position)
 
-        out_of_bounds = distance > self.config.max_distance
+        out_of_bounds = distance_sq > self._max_distance_sq
 
         if out_of_bounds:
             reward = -self.config.scale
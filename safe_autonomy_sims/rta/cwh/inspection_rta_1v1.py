@@ -142,12 +142,11 @@ class UpdatedInspection1v1RTA(Inspection1v1RTA):
 
     def _get_state(self, input_state):
         if len(input_state) == 7:
-            input_state = np.array(input_state)
-            input_state = np.concatenate((input_state, np.array([0.])))
-            theta = input_state[6]
-            m = math.floor(abs(theta / (2 * np.pi)))
-            theta -= np.sign(theta) * m * 2 * np.pi
-            input_state[6] = 2 * np.pi - theta
+            state = np.zeros(8)
+            state[:7] = input_state
+            # fmod truncates toward zero, keeping the sign of theta
+            state[6] = 2 * math.pi - math.fmod(state[6], 2 * math.pi)
         else:
-            input_state = np.concatenate((input_state, np.array([0., 0.])))
-        return to_jnp_array_jit(input_state)
+            state = np.zeros(len(input_state) + 2)
+            state[:-2] = input_state
+        return to_jnp_array_jit(state)
@@ -37,6 +37,7 @@ from safe_autonomy_sims.simulators.saferl_simulator import (
     SafeRLSimulatorState,
     SafeRLSimulatorValidator,
 )
+from safe_autonomy_sims.utils import rotate_by_quaternion
 
 
 class IlluminationValidator(BaseModel):
@@ -126,6 +127,14 @@ class InspectionPoints:
         self.init_priority_vector = copy.deepcopy(self.priority_vector)
         (self._default_points_position_dict, self.points_position_dict, self.points_inspected_dict,
          self.points_weights_dict) = self._add_points()
+        self._num_points = len(self.points_inspected_dict)
+        self._num_points_inspected = 0
+        self._num_points_inspected_by: typing.Dict[str, int] = {}
+        self._points_weight_inspected_by: typing.Dict[str, float] = {}
+        # array mirrors of the points dicts, indexed by point id
+        self._points_weights = np.fromiter(self.points_weights_dict.values(), dtype=np.float64, count=self._num_points)
+        self._points_inspected_mask = np.zeros(self._num_points, dtype=bool)
+        self._default_points_position = np.array(list(self._default_points_position_dict.values()), dtype=np.float64)
         self.last_points_inspected = 0
         self.last_cluster = None
 
@@ -155,21 +164,21 @@ class InspectionPoints:
         else:
             points_alg = InspectionPoints.points_on_sphere_fibonacci
         points = points_alg(self.config.num_points, self.config.radius)  # TODO: HANDLE POSITION UNITS*
-        points_position_dict = {}
-        points_inspected_dict = {}
-        points_weights_dict = {}
-        for i, point in enumerate(points):
-            points_position_dict[i] = point
-            points_inspected_dict[i] = False
-            points_weights_dict[i] = np.arccos(
-                np.dot(-self.priority_vector, point) / (np.linalg.norm(-self.priority_vector) * np.linalg.norm(point))
-            ) / np.pi
+        points_array = np.array(points, dtype=np.float64)
+        point_ids = range(len(points_array))
+
+        # angle between each point and the reversed priority vector, computed for all points at once
+        weights = np.arccos(
+            (points_array @ -self.priority_vector) / (np.linalg.norm(self.priority_vector) * np.linalg.norm(points_array, axis=1))
+        ) / np.pi
 
         # Normalize weighting
-        total_weight = sum(list(points_weights_dict.values()))
-        points_weights_dict = {k: w / total_weight for k, w in points_weights_dict.items()}
+        total_weight = sum(weights.tolist())
+        points_weights_dict = dict(zip(point_ids, (weights / total_weight).tolist()))
 
-        default_points_position = copy.deepcopy(points_position_dict)
+        points_position_dict = dict(zip(point_ids, points_array))
+        points_inspected_dict = dict.fromkeys(point_ids, False)
+        default_points_position = dict(zip(point_ids, points_array.copy()))
 
         return default_points_position, points_position_dict, points_inspected_dict, points_weights_dict
 
@@ -190,8 +199,8 @@ class InspectionPoints:
         # calculate h of the spherical cap (inspection zone)
         position = inspector_entity.position
         if isinstance(inspector_entity, SixDOFSpacecraft):
-            rotation = Rotation.from_quat(inspector_entity.orientation)
-            r_c = rotation.apply(self.config.initial_sensor_unit_vec)
+            # sensor boresight in the inspector's current attitude, straight from its quaternion
+            r_c = rotate_by_quaternion(inspector_entity.orientation, np.asarray(self.config.initial_sensor_unit_vec, dtype=np.float64))
         else:
             r_c = -position
         r_c = r_c / np.linalg.norm(r_c)
@@ -214,7 +223,7 @@ class InspectionPoints:
                     if not self.config.illumination_params:
                         # project point onto inspection zone axis and check if in inspection zone
                         if np.dot(point_position, p_hat) >= r - h:
-                            self.points_inspected_dict[point_id] = inspector_entity.name
+                            self._mark_point_inspected(point_id, inspector_entity.name)
                     else:
                         mag = np.dot(point_position, p_hat)
                         if mag >= r - h:
@@ -224,13 +233,32 @@ class InspectionPoints:
                             current_theta = self.sun_angle
                             if self.config.illumination_params.bin_ray_flag:
                                 if illum.check_illum(point_position, current_theta, r_avg, r):
-                                    self.points_inspected_dict[point_id] = inspector_entity.name
+                                    self._mark_point_inspected(point_id, inspector_entity.name)
                             else:
                                 RGB = illum.compute_illum_pt(
                                     point_position, current_theta, position, r_avg, r, chief_properties, light_properties
                                 )
                                 if illum.evaluate_RGB(RGB):
-                                    self.points_inspected_dict[point_id] = inspector_entity.name
+                                    self._mark_point_inspected(point_id, inspector_entity.name)
+
+    def _mark_point_inspected(self, point_id, inspector_name: str):
+        """
+        Record that a point has been inspected and update the running inspected counts and weights.
+
+        Parameters
+        ----------
+        point_id : int
+            id of the inspected point
+        inspector_name : str
+            name of the inspector entity
+        """
+        self.points_inspected_dict[point_id] = inspector_name
+        self._points_inspected_mask[point_id] = True
+        self._num_points_inspected += 1
+        self._num_points_inspected_by[inspector_name] = self._num_points_inspected_by.get(inspector_name, 0) + 1
+        self._points_weight_inspected_by[inspector_name] = (
+            self._points_weight_inspected_by.get(inspector_name, 0.) + self.points_weights_dict[point_id]
+        )
 
     def kmeans_find_nearest_cluster(self, position):
         """Finds nearest cluster of uninspected points using kmeans clustering
@@ -400,25 +428,31 @@ class InspectionPoints:
 
         self.priority_vector = parent_orientation.apply(self.init_priority_vector)
 
-        for point_id, default_position in self._default_points_position_dict.items():
-            # rotate about origin
-            new_position = parent_orientation.apply(default_position)
-            # translate from origin
-            new_position = new_position + parent_position
-            self.points_position_dict[point_id] = new_position
+        # rotate all points about origin in one call, then translate from origin
+        new_positions = parent_orientation.apply(self._default_points_position) + parent_position
+        self.points_position_dict.update(zip(self._default_points_position_dict, new_positions))
 
     # getters / setters
+    @property
+    def all_inspected(self) -> bool:
+        """True if every inspection point has been inspected"""
+        return self._num_points_inspected == self._num_points
+
+    @property
+    def points_inspected_mask(self) -> np.ndarray:
+        """Read-only boolean array of point inspection status, indexed by point id"""
+        mask = self._points_inspected_mask.view()
+        mask.flags.writeable = False
+        return mask
+
     def get_num_points_inspected(self, inspector_entity: Entity = None):
         """Get total number of points inspected"""
-        num_points = 0
         if inspector_entity:
             # count number of points inspected by the provided entity
-            for _, point_inspector_entity in self.points_inspected_dict.items():
-                num_points += 1 if point_inspector_entity == inspector_entity.name else 0
+            num_points = self._num_points_inspected_by.get(inspector_entity.name, 0)
         else:
             # count the total number of points inspected
-            for _, point_inspector_entity in self.points_inspected_dict.items():
-                num_points += 1 if point_inspector_entity else 0
+            num_points = self._num_points_inspected
 
         return num_points
 
@@ -438,14 +472,10 @@ class InspectionPoints:
 
     def get_total_weight_inspected(self, inspector_entity: Entity = None):
         """Get total weight of points inspected"""
-        weights = 0
         if inspector_entity:
-            for point_inspector_entity, weight in zip(self.points_inspected_dict.values(), self.points_weights_dict.values()):
-                weights += weight if point_inspector_entity == inspector_entity.name else 0.
-        else:
-            for point_inspector_entity, weight in zip(self.points_inspected_dict.values(), self.points_weights_dict.values()):
-                weights += weight if point_inspector_entity else 0.
-        return weights
+            # sum of weights of points inspected by the provided entity
+            return self._points_weight_inspected_by.get(inspector_entity.name, 0.)
+        return float(self._points_weights @ self._points_inspected_mask)
 
     def set_sun_angle(self, sun_angle: np.ndarray):
         """Get the current sun angle"""
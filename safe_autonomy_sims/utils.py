@@ -11,6 +11,7 @@ limitation or restriction. See accompanying README and LICENSE for details.
 
 This module contains various utility functions.
 """
+import math
 import typing
 
 import numpy as np
@@ -18,6 +19,15 @@ from corl.simulators.base_platform import BasePlatform
 from corl.simulators.common_platform_utils import get_sensor_by_name
 from pydantic import BaseModel
 
+from safe_autonomy_sims.platforms.common.platform import BaseSafeRLPlatform
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    # numba is an optional accelerator (the "numba" extra); kernels below fall back to numpy / plain python
+    _HAS_NUMBA = False
+
 
 def shallow_dict_merge(a: typing.Dict, b: typing.Dict, in_place: bool = False, allow_collisions: bool = True):
     """
@@ -44,11 +54,14 @@ def shallow_dict_merge(a: typing.Dict, b: typing.Dict, in_place: bool = False, a
     else:
         output = {**a}
 
+    if allow_collisions:
+        # setdefault keeps a's value on collision and appends new keys in b's order
+        for k, v in b.items():
+            output.setdefault(k, v)
+        return output
+
     for k, v in b.items():
         if k in output:
-            if allow_collisions:
-                continue
-
             raise KeyCollisionError(k)
 
         output[k] = v
@@ -74,7 +87,16 @@ class KeyCollisionError(Exception):
         super().__init__(message)
 
 
-def get_relative_position(platform: BasePlatform, reference_position_sensor_name: str):
+def _get_platform_sensor(platform: BasePlatform, sensor_name: str):
+    """
+    Get a sensor by name, using the platform's sensor cache when it has one.
+    """
+    if isinstance(platform, BaseSafeRLPlatform):
+        return platform.get_sensor(sensor_name)
+    return get_sensor_by_name(platform, sensor_name)
+
+
+def get_relative_position(platform: BasePlatform, reference_position_sensor_name: str, out: typing.Optional[np.ndarray] = None):
     """
     Finds the relative position between a platform and its reference_position Sensor's returned position.
 
@@ -84,6 +106,8 @@ def get_relative_position(platform: BasePlatform, reference_position_sensor_name
         The name of the platform whose relative position will be returned
     reference_position_sensor_name: str
         The name of the sensor on the platform responsible for tracking the absolute position of a reference entity
+    out: numpy.ndarray, optional
+        Preallocated float array of shape (3,) to write the result into. By default a new array is allocated.
 
     Returns
     -------
@@ -92,8 +116,8 @@ def get_relative_position(platform: BasePlatform, reference_position_sensor_name
     """
 
     position = platform.position
-    reference_position = get_sensor_by_name(platform, reference_position_sensor_name).get_measurement()
-    relative_position = np.array(position) - reference_position.m
+    reference_position = _get_platform_sensor(platform, reference_position_sensor_name).get_measurement()
+    relative_position = np.subtract(position, reference_position.m, out=out)
 
     return relative_position
 
@@ -116,8 +140,8 @@ def get_relative_velocity(platform: BasePlatform, reference_velocity_sensor_name
     """
 
     velocity = platform.velocity
-    reference_velocity = get_sensor_by_name(platform, reference_velocity_sensor_name).get_measurement()
-    relative_velocity = np.array(velocity) - reference_velocity.m
+    reference_velocity = _get_platform_sensor(platform, reference_velocity_sensor_name).get_measurement()
+    relative_velocity = np.subtract(velocity, reference_velocity.m)
 
     return relative_velocity
 
@@ -145,10 +169,16 @@ def velocity_limit(distance, velocity_threshold, threshold_distance, mean_motion
         The velocity limit given the platform's position.
     """
 
-    vel_limit = velocity_threshold
-    if distance > threshold_distance:
-        vel_limit += slope * mean_motion * (distance - threshold_distance)
-    return vel_limit
+    return velocity_threshold + slope * mean_motion * max(distance - threshold_distance, 0.0)
+
+
+def _vector_norm(vector) -> float:
+    """
+    Euclidean norm of a short vector, computed on python floats to skip numpy's norm dispatch.
+    """
+    if isinstance(vector, np.ndarray):
+        vector = vector.tolist()
+    return math.hypot(*vector)
 
 
 def max_vel_violation(relative_position, relative_velocity, velocity_threshold, threshold_distance, mean_motion, lower_bound, slope=2.0):
@@ -179,8 +209,8 @@ def max_vel_violation(relative_position, relative_velocity, velocity_threshold,
     violation: float
         The magnitude of the velocity limit violation.
     """
-    distance = np.linalg.norm(relative_position)
-    relative_velocity_magnitude = np.linalg.norm(relative_velocity)
+    distance = _vector_norm(relative_position)
+    relative_velocity_magnitude = _vector_norm(relative_velocity)
 
     vel_limit = velocity_limit(distance, velocity_threshold, threshold_distance, mean_motion, slope=slope)
 
@@ -217,6 +247,32 @@ class VelocityConstraintValidator(BaseModel):
     slope: float = 2.0
 
 
+def rotate_by_quaternion(quaternion: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """
+    Rotate one or more 3D vectors by a quaternion without constructing a scipy Rotation.
+
+    Uses v' = v + w * t + q_v x t with t = 2 * (q_v x v), which matches
+    scipy.spatial.transform.Rotation.from_quat(quaternion).apply(vectors).
+
+    Parameters
+    ----------
+    quaternion: np.ndarray
+        Rotation quaternion in scalar-last (x, y, z, w) format. Normalized before use.
+    vectors: np.ndarray
+        Vector of shape (3,) or stack of vectors of shape (N, 3) to rotate
+
+    Returns
+    -------
+    np.ndarray
+        Rotated vector(s), same shape as vectors
+    """
+    q = np.asarray(quaternion, dtype=np.float64)
+    q = q / math.sqrt(float(q @ q))
+    q_v = q[:3]
+    t = 2.0 * np.cross(q_v, vectors)
+    return vectors + q[3] * t + np.cross(q_v, t)
+
+
 def get_closest_fft_distance(state: np.ndarray, n: float, time_array: typing.Union[np.ndarray, list]) -> float:
     """
     Get the closest Free Flight Trajectory (FFT) distance over a given time horizon.
@@ -236,12 +292,216 @@ def get_closest_fft_distance(state: np.ndarray, n: float, time_array: typing.Uni
     float
         Closest relative distance to the origin achieved during the FFT
     """
+    time_array = np.asarray(time_array, dtype=np.float64)
+    sin_nt = np.sin(n * time_array)
+    cos_nt = np.cos(n * time_array)
+    return get_closest_fft_distance_cached(state, n, time_array, sin_nt, cos_nt)
+
+
+def get_closest_fft_distance_cached(state: np.ndarray, n: float, time_array: np.ndarray, sin_nt: np.ndarray, cos_nt: np.ndarray) -> float:
+    """
+    Get the closest Free Flight Trajectory (FFT) distance over a given time horizon,
+    reusing precomputed sin(n*t) and cos(n*t) terms.
+
+    Callers that evaluate the FFT repeatedly over the same time horizon should
+    compute the trigonometric terms once and pass them in here.
+
+    Parameters
+    ----------
+    state: np.ndarray
+        Initial state
+    n: float
+        Orbital mean motion of Hill's reference frame's circular orbit in rad/s
+    time_array: np.ndarray
+        Array containing each point in time to check the FFT trajectory
+    sin_nt: np.ndarray
+        sin(n * time_array)
+    cos_nt: np.ndarray
+        cos(n * time_array)
+
+    Returns
+    -------
+    float
+        Closest relative distance to the origin achieved during the FFT
+    """
+
+    return math.sqrt(get_closest_fft_distance_sq_cached(state, n, time_array, sin_nt, cos_nt))
+
+
+def get_closest_fft_distance_sq_cached(
+    state: np.ndarray, n: float, time_array: np.ndarray, sin_nt: np.ndarray, cos_nt: np.ndarray
+) -> float:
+    """
+    Get the squared closest Free Flight Trajectory (FFT) distance over a given time horizon,
+    reusing precomputed sin(n*t) and cos(n*t) terms.
+
+    Useful when the distance is only compared against a threshold, as the square root can be skipped.
+
+    Parameters
+    ----------
+    state: np.ndarray
+        Initial state
+    n: float
+        Orbital mean motion of Hill's reference frame's circular orbit in rad/s
+    time_array: np.ndarray
+        Array containing each point in time to check the FFT trajectory
+    sin_nt: np.ndarray
+        sin(n * time_array)
+    cos_nt: np.ndarray
+        cos(n * time_array)
+
+    Returns
+    -------
+    float
+        Squared closest relative distance to the origin achieved during the FFT
+
+    Raises
+    ------
+    ValueError
+        If time_array is empty.
+    """
+    if len(time_array) == 0:
+        raise ValueError("time_array must contain at least one point in time")
+
+    return _closest_fft_distance_sq(
+        float(state[0]),
+        float(state[1]),
+        float(state[2]),
+        float(state[3]),
+        float(state[4]),
+        float(state[5]),
+        float(n),
+        time_array,
+        sin_nt,
+        cos_nt,
+    )
+
+
+def _closest_fft_distance_sq_loop(x0, y0, z0, vx0, vy0, vz0, n, time_array, sin_nt, cos_nt):
+    """
+    Single pass over the FFT time horizon tracking the minimum squared distance to the origin.
+    Used when numba is installed.
+    """
+    min_dist_sq = 0.0
+    for i in range(time_array.shape[0]):
+        nt = n * time_array[i]
+        sin_t = sin_nt[i]
+        cos_t = cos_nt[i]
+        x = (4 - 3 * cos_t) * x0 + sin_t * vx0 / n + 2 / n * (1 - cos_t) * vy0
+        y = 6 * (sin_t - nt) * x0 + y0 - 2 / n * (1 - cos_t) * vx0 + (4 * sin_t - 3 * nt) * vy0 / n
+        z = z0 * cos_t + vz0 / n * sin_t
+        dist_sq = x * x + y * y + z * z
+        # seed from the first sample rather than an infinite sentinel
+        if i == 0 or dist_sq < min_dist_sq:
+            min_dist_sq = dist_sq
+    return min_dist_sq
+
+
+def _closest_fft_distance_sq_vectorized(x0, y0, z0, vx0, vy0, vz0, n, time_array, sin_nt, cos_nt):
+    """
+    Evaluate the FFT over the whole time horizon at once and return the minimum squared distance to the origin.
+    Used when numba is not installed.
+    """
+    one_minus_cos = 1 - cos_nt
+    nt = n * time_array
+
+    x = (4 - 3 * cos_nt) * x0
+    x += sin_nt * (vx0 / n)
+    x += one_minus_cos * (2 / n * vy0)
+
+    y = (sin_nt - nt) * (6 * x0)
+    y += y0
+    y -= one_minus_cos * (2 / n * vx0)
+    y += (4 * sin_nt - 3 * nt) * (vy0 / n)
+
+    z = cos_nt * z0
+    z += sin_nt * (vz0 / n)
 
-    distances = []
-    for t in time_array:
-        x = (4 - 3 * np.cos(n * t)) * state[0] + np.sin(n * t) * state[3] / n + 2 / n * (1 - np.cos(n * t)) * state[4]
-        y = 6 * (np.sin(n * t) - n * t) * state[0] + state[1] - 2 / n * (1 - np.cos(n * t)) * state[3] + (4 * np.sin(n * t) -
-                                                                                                          3 * n * t) * state[4] / n
-        z = state[2] * np.cos(n * t) + state[5] / n * np.sin(n * t)
-        distances.append(np.linalg.norm([x, y, z]))
-    return float(min(distances))
+    x *= x
+    x += y * y
+    x += z * z
+    return float(x.min())
+
+
+_closest_fft_distance_sq: typing.Callable[..., float]
+if _HAS_NUMBA:
+    _closest_fft_distance_sq = njit(cache=True)(_closest_fft_distance_sq_loop)
+else:
+    _closest_fft_distance_sq = _closest_fft_distance_sq_vectorized
+
+
+# below this many positions, checking every pair is cheaper than building a kd-tree
+_KDTREE_MIN_POSITIONS = 8
+
+
+def _any_collision_sq_loop(positions, skip, safety_constraint_sq):
+    """
+    Pairwise squared distance check that stops at the first violation.
+    Used for small position counts when numba is installed.
+    """
+    n = positions.shape[0]
+    for i in range(n - 1):
+        if skip[i]:
+            continue
+        for j in range(i + 1, n):
+            dx = positions[i, 0] - positions[j, 0]
+            dy = positions[i, 1] - positions[j, 1]
+            dz = positions[i, 2] - positions[j, 2]
+            if dx * dx + dy * dy + dz * dz < safety_constraint_sq:
+                return True
+    return False
+
+
+_any_collision_sq: typing.Callable[..., bool]
+if _HAS_NUMBA:
+    _any_collision_sq = njit(cache=True)(_any_collision_sq_loop)
+
+
+def any_collision(positions: np.ndarray, skip: np.ndarray, safety_constraint: float) -> bool:
+    """
+    Check whether any pair of positions is closer than the safety constraint.
+
+    Pairs are checked once, in order: the pair (i, j) with i < j is skipped when skip[i] is set.
+    Fewer than _KDTREE_MIN_POSITIONS positions are checked pairwise, with the numba kernel when
+    it is installed; larger sets always use a kd-tree broad phase.
+
+    Parameters
+    ----------
+    positions: numpy.ndarray
+        (N, 3) float array of positions.
+    skip: numpy.ndarray
+        (N,) bool array, true for positions that should not be checked against later positions.
+    safety_constraint: float
+        Minimum distance that must be maintained between positions.
+
+    Returns
+    -------
+    bool
+        True if any checked pair is strictly closer than safety_constraint.
+    """
+    safety_constraint_sq = safety_constraint**2
+    if positions.shape[0] < _KDTREE_MIN_POSITIONS:
+        if _HAS_NUMBA:
+            return bool(_any_collision_sq(positions, skip, safety_constraint_sq))
+        # few pairs, plain python floats avoid numpy dispatch overhead entirely
+        points = positions.tolist()
+        for i, ((x0, y0, z0), skip_i) in enumerate(zip(points, skip.tolist())):
+            if skip_i:
+                continue
+            for x1, y1, z1 in points[i + 1:]:
+                dx = x0 - x1
+                dy = y0 - y1
+                dz = z0 - z1
+                if dx * dx + dy * dy + dz * dz < safety_constraint_sq:
+                    return True
+        return False
+
+    # imported here so the scipy.spatial import cost is only paid when the kd-tree path is used
+    from scipy.spatial import cKDTree  # pylint: disable=import-outside-toplevel
+
+    # kd-tree broad phase; query_pairs is inclusive, so recheck the strict bound
+    pairs = cKDTree(positions).query_pairs(safety_constraint, output_type="ndarray")
+    offsets = positions[pairs[:, 0]] - positions[pairs[:, 1]]
+    collisions = np.einsum("ij,ij->i", offsets, offsets) < safety_constraint_sq
+    collisions &= ~skip[pairs[:, 0]]
+    return bool(collisions.any())
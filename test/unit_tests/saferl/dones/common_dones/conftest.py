@@ -12,16 +12,14 @@
 This module defines fixtures common to common dones testing.
 """
 
-from unittest import mock
-
 import pytest
 
 
 @pytest.fixture()
-def call_results(cut, observation, action, next_observation, next_state, observation_space, observation_units, platform):
+def call_results(cut, observation, action, next_observation, next_state, observation_space, observation_units):
     """
     A fixture responsible for calling the appropriate component under test and returns the results.
-    This variation of the function is specific to docking_dones
+    This variation of the function is specific to common_dones
 
     Parameters
     ----------
@@ -34,16 +32,15 @@ def call_results(cut, observation, action, next_observation, next_state, observa
     next_observation : numpy.ndarray
         The next_observation array
     next_state : StateDict
-        The StateDict that the DockingVelocityLimitDoneFunction mutates
-    platform : MagicMock
-        The mock platform to be returned to the DockingVelocityLimitDoneFunction when it uses get_platform_by_name()
+        The StateDict that the DoneFunction reads and mutates
+    observation_space : StateDict
+        The observation space
+    observation_units : StateDict
+        The observation units
 
     Returns
     -------
     results : DoneDict
-        The resulting DoneDict from calling the DockingVelocityLimitDoneFunction
+        The resulting DoneDict from calling the DoneFunction
     """
-    with mock.patch("safe_autonomy_sims.dones.common_dones.get_platform_by_name") as func:
-        func.return_value = platform
-        results = cut(observation, action, next_observation, next_state, observation_space, observation_units)
-        return results
+    return cut(observation, action, next_observation, next_state, observation_space, observation_units)
@@ -0,0 +1,166 @@
+"""
+# -------------------------------------------------------------------------------
+# Air Force Research Laboratory (AFRL) Autonomous Capabilities Team (ACT3)
+# Reinforcement Learning Core (CoRL) Runtime Assurance Extensions
+#
+# This is a US Government Work not subject to copyright protection in the US.
+#
+# The use, dissemination or disclosure of data in this file is subject to
+# limitation or restriction. See accompanying README and LICENSE for details.
+# -------------------------------------------------------------------------------
+
+This module holds unit tests and fixtures for the CollisionDoneFunction.
+"""
+
+import os
+from collections import OrderedDict
+from unittest import mock
+
+import numpy as np
+import pytest
+from corl.libraries.environment_dict import DoneDict
+from corl.libraries.state_dict import StateDict
+
+from safe_autonomy_sims.dones.common_dones import CollisionDoneFunction
+from test.conftest import delimiter, read_test_cases
+
+# Define test assay
+test_cases_file_path = os.path.join(os.path.split(__file__)[0], "../../../../test_cases/dones/common/CollisionDoneFunction_test_cases.yaml")
+parameterized_fixture_keywords = ["platform_positions", "local_dones", "safety_constraint", "expected_value"]
+test_configs, IDs = read_test_cases(test_cases_file_path, parameterized_fixture_keywords)
+
+
+@pytest.fixture(name='platform_positions')
+def fixture_platform_positions(request):
+    """
+    Parameterized fixture for returning the positions of each platform in the simulation, keyed by platform name,
+    as defined in test_configs.
+
+    Returns
+    -------
+    dict
+        The position of each platform
+    """
+    return request.param
+
+
+@pytest.fixture(name='local_dones')
+def fixture_local_dones(request):
+    """
+    Parameterized fixture for returning the DoneDict of each agent's local done status,
+    as defined in test_configs.
+
+    Returns
+    -------
+    DoneDict
+        The done status of each agent, including the '__all__' key
+    """
+    local_dones = DoneDict()
+    local_dones.update(request.param)
+    return local_dones
+
+
+@pytest.fixture(name='safety_constraint')
+def fixture_safety_constraint(request):
+    """
+    Parameterized fixture for returning the minimum distance that must be maintained between platforms,
+    passed to the CollisionDoneFunction's constructor, as defined in test_configs.
+
+    Returns
+    -------
+    float
+        The safety constraint in meters
+    """
+    return request.param
+
+
+@pytest.fixture(name='next_state')
+def fixture_next_state(platform_positions):
+    """
+    A fixture for creating a StateDict with the sim platforms read by the CollisionDoneFunction.
+    There is no platform named '__all__', so reading one would raise a KeyError.
+
+    Parameters
+    ----------
+    platform_positions : dict
+        The position of each platform
+
+    Returns
+    -------
+    state : StateDict
+        The populated StateDict
+    """
+    sim_platforms = {}
+    for name, position in platform_positions.items():
+        platform = mock.MagicMock(name=name)
+        platform.position = np.array(position, dtype=float)
+        sim_platforms[name] = platform
+    return StateDict({"sim_platforms": sim_platforms})
+
+
+@pytest.fixture(name='cut')
+def fixture_cut(cut_name, safety_constraint):
+    """
+    A fixture that instantiates a CollisionDoneFunction and returns it.
+
+    Parameters
+    ----------
+    cut_name : str
+        The name of the component under test
+    safety_constraint : float
+        The minimum distance that must be maintained between platforms
+
+    Returns
+    -------
+    CollisionDoneFunction
+        An instantiated component under test
+    """
+    return CollisionDoneFunction(name=cut_name, safety_constraint=safety_constraint)
+
+
+@pytest.fixture(name='call_results')
+def fixture_call_results(cut, observation, action, next_observation, next_state, observation_space, observation_units, local_dones):
+    """
+    A fixture responsible for calling the CollisionDoneFunction and returning the results.
+
+    Parameters
+    ----------
+    cut : CollisionDoneFunction
+        The component under test
+    observation : numpy.ndarray
+        The observation array
+    action : numpy.ndarray
+        The action array
+    next_observation : numpy.ndarray
+        The next_observation array
+    next_state : StateDict
+        The StateDict read by the CollisionDoneFunction
+    observation_space : StateDict
+        The observation space
+    observation_units : StateDict
+        The observation units
+    local_dones : DoneDict
+        The done status of each agent
+
+    Returns
+    -------
+    results : DoneDict
+        The resulting DoneDict from calling the CollisionDoneFunction
+    """
+    return cut(observation, action, next_observation, next_state, observation_space, observation_units, local_dones, OrderedDict())
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize(delimiter.join(parameterized_fixture_keywords), test_configs, indirect=True, ids=IDs)
+def test_call(call_results, expected_value):
+    """
+    A parameterized test to ensure that the CollisionDoneFunction behaves as intended.
+
+    Parameters
+    ----------
+    call_results : DoneDict
+        The resulting DoneDict from calling the CollisionDoneFunction
+    expected_value : dict
+        The expected done status of every agent, including the '__all__' key
+    """
+    assert dict(call_results) == expected_value
@@ -17,6 +17,7 @@ Author: John McCarroll
 import os
 
 import pytest
+from corl.libraries.state_dict import StateDict
 
 from safe_autonomy_sims.dones.common_dones import TimeoutDoneFunction
 from test.conftest import delimiter, read_test_cases
@@ -55,6 +56,28 @@ def fixture_sim_time(request):
     return request.param
 
 
+@pytest.fixture(name='next_state')
+def fixture_next_state(agent_name, cut_name, sim_time):
+    """
+    A fixture for creating a StateDict with the simulation time read by the TimeoutDoneFunction.
+
+    Parameters
+    ----------
+    agent_name : str
+        The name of the agent
+    cut_name : str
+        The name of the component under test
+    sim_time : float
+        The current simulation time
+
+    Returns
+    -------
+    state : StateDict
+        The populated StateDict
+    """
+    return StateDict({"episode_state": {agent_name: {cut_name: None}}, "sim_time": sim_time})
+
+
 @pytest.fixture(name='cut')
 def fixture_cut(cut_name, agent_name, max_sim_time):
     """
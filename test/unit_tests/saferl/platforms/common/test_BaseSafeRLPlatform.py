@@ -0,0 +1,88 @@
+"""
+# -------------------------------------------------------------------------------
+# Air Force Research Laboratory (AFRL) Autonomous Capabilities Team (ACT3)
+# Reinforcement Learning Core (CoRL) Runtime Assurance Extensions
+#
+# This is a US Government Work not subject to copyright protection in the US.
+#
+# The use, dissemination or disclosure of data in this file is subject to
+# limitation or restriction. See accompanying README and LICENSE for details.
+# -------------------------------------------------------------------------------
+
+Tests for the BaseSafeRLPlatform sensor lookup
+"""
+
+from unittest import mock
+
+import pytest
+from corl.simulators.base_parts import BaseSensor
+from corl.simulators.common_platform_utils import get_sensor_by_name
+
+from safe_autonomy_sims.platforms.common.platform import BaseSafeRLPlatform
+from safe_autonomy_sims.utils import _get_platform_sensor
+
+
+class SafeRLTestPlatform(BaseSafeRLPlatform):
+    """
+    Minimal concrete BaseSafeRLPlatform, only implementing the abstract operable property
+    """
+
+    @property
+    def operable(self):
+        return True
+
+
+@pytest.fixture(name='sensors')
+def fixture_sensors():
+    """
+    Mock sensor parts keyed by name
+    """
+    return {name: mock.MagicMock(spec=BaseSensor) for name in ("Sensor_Position", "Sensor_Velocity")}
+
+
+@pytest.fixture(name='safe_rl_platform')
+def fixture_safe_rl_platform(sensors):
+    """
+    A BaseSafeRLPlatform with the mock sensors attached
+    """
+    platform = SafeRLTestPlatform(platform_name="blue0", platform=mock.MagicMock(), parts_list=[])
+    platform._sensors = sensors  # pylint: disable=W0212
+    return platform
+
+
+@pytest.mark.unit_test
+def test_get_sensor_looks_up_each_name_once(safe_rl_platform, sensors):
+    """
+    Test that get_sensor only searches the parts list the first time each sensor name is requested
+    """
+    with mock.patch("safe_autonomy_sims.platforms.common.platform.get_sensor_by_name", wraps=get_sensor_by_name) as lookup:
+        for _ in range(3):
+            for name, sensor in sensors.items():
+                assert safe_rl_platform.get_sensor(name) is sensor
+                assert _get_platform_sensor(safe_rl_platform, name) is sensor
+
+    assert lookup.call_args_list == [mock.call(safe_rl_platform, name) for name in sensors]
+
+
+@pytest.mark.unit_test
+def test_get_sensor_missing_name(safe_rl_platform):
+    """
+    Test that a missing sensor still raises and is not cached
+    """
+    with pytest.raises(RuntimeError):
+        safe_rl_platform.get_sensor("Sensor_Missing")
+    assert "Sensor_Missing" not in safe_rl_platform._sensor_by_name  # pylint: disable=W0212
+
+
+@pytest.mark.unit_test
+def test_get_platform_sensor_other_platform(sensors):
+    """
+    Test that platforms which are not a BaseSafeRLPlatform fall back to get_sensor_by_name on every call
+    """
+    platform = mock.MagicMock()
+    sensor = sensors["Sensor_Position"]
+    with mock.patch("safe_autonomy_sims.utils.get_sensor_by_name", return_value=sensor) as lookup:
+        assert _get_platform_sensor(platform, "Sensor_Position") is sensor
+        assert _get_platform_sensor(platform, "Sensor_Position") is sensor
+
+    assert lookup.call_count == 2
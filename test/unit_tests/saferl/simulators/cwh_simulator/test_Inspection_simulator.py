@@ -133,3 +133,19 @@ def test_inspection_point_status(inspection_points, inspector_entity, expected_i
     for id, inspected in points.items():
         expected = expected_inspection[id]
         assert expected==inspected, f"Resulting inspected point does not equal expected inspected point for PointID {id}: {expected} != {inspected}"
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize(delimiter.join(parameterized_fixture_keywords_insp), test_configs_insp, ids=IDs_insp, indirect=True)
+def test_inspection_point_counters(inspection_points, inspector_entity, expected_inspection):
+    """Test that the InspectionPoints running inspection counters agree with the inspected points dict."""
+    inspection_points.update_points_inspection_status(inspector_entity)
+
+    expected_num_inspected = sum(1 for inspected in expected_inspection.values() if inspected)
+    expected_weight = sum(inspection_points.points_weights_dict[id] for id, inspected in expected_inspection.items() if inspected)
+
+    assert inspection_points.get_num_points_inspected() == expected_num_inspected
+    assert inspection_points.get_num_points_inspected(inspector_entity=inspector_entity) == expected_num_inspected
+    assert np.array_equal(inspection_points.points_inspected_mask, [bool(v) for v in expected_inspection.values()])
+    assert inspection_points.all_inspected == all(expected_inspection.values())
+    assert np.isclose(inspection_points.get_total_weight_inspected(), expected_weight)
+    assert np.isclose(inspection_points.get_total_weight_inspected(inspector_entity=inspector_entity), expected_weight)
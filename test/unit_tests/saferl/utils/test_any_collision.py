@@ -0,0 +1,120 @@
+"""
+# -------------------------------------------------------------------------------
+# Air Force Research Laboratory (AFRL) Autonomous Capabilities Team (ACT3)
+# Reinforcement Learning Core (CoRL) Runtime Assurance Extensions
+#
+# This is a US Government Work not subject to copyright protection in the US.
+#
+# The use, dissemination or disclosure of data in this file is subject to
+# limitation or restriction. See accompanying README and LICENSE for details.
+# -------------------------------------------------------------------------------
+
+This module holds unit tests for any_collision.
+"""
+
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from safe_autonomy_sims.utils import _any_collision_sq_loop, any_collision
+
+
+def reference_any_collision(positions, skip, safety_constraint):
+    """
+    Brute force pairwise check used as ground truth
+    """
+    for i in range(len(positions)):
+        for j in range(i + 1, len(positions)):
+            if not skip[i] and np.linalg.norm(positions[i] - positions[j]) < safety_constraint:
+                return True
+    return False
+
+
+# skip masks come from their own seed so they are not tied to the geometry they are paired with
+collision_cases = [
+    (np.random.default_rng(seed).uniform(0, 10, (num, 3)), np.random.default_rng(seed + 100).random(num) < 0.3)
+    for seed, num in enumerate([2, 3, 5, 7, 8, 12, 30])
+]
+
+
+def spread_positions(num):
+    """
+    Positions 10 apart along x, so no pair collides until the test moves points together
+    """
+    positions = np.zeros((num, 3))
+    positions[:, 0] = 10.0 * np.arange(num)
+    return positions
+
+
+def hand_built_case(num, close_pairs, skipped):
+    """
+    Build positions where only close_pairs are within the safety constraint, with skipped indices set in the mask
+    """
+    positions = spread_positions(num)
+    for i, j in close_pairs:
+        positions[j] = positions[i] + [0.0, 0.25, 0.0]
+    skip = np.zeros(num, dtype=bool)
+    skip[list(skipped)] = True
+    return positions, skip
+
+
+# (num positions, close pairs (i, j) with i < j, skipped indices, expected collision)
+# size 3 takes the pairwise path and size 10 the kd-tree path
+hand_built_cases = [
+    case for num in (3, 10) for case in [
+        (num, [(0, 1)], [], True),
+        # the only colliding pair is skipped through its lower index
+        (num, [(0, 1)], [0], False),
+        # skip only applies to the lower index of a pair
+        (num, [(0, 1)], [1], True),
+        (num, [(1, 2)], [2], True),
+        # every index but the last is skipped, and the last has no later positions to check
+        (num, [(1, num - 1)], range(num - 1), False),
+        (num, [(0, 2), (1, 2)], [0], True),
+        (num, [(0, 2), (1, 2)], [0, 1], False),
+    ]
+]
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("num,close_pairs,skipped,expected", hand_built_cases)
+def test_any_collision_skip(num, close_pairs, skipped, expected):
+    """
+    Test skip handling of every any_collision path on hand-built geometries
+    """
+    positions, skip = hand_built_case(num, close_pairs, skipped)
+    assert _any_collision_sq_loop(positions, skip, 0.25) == expected
+    assert any_collision(positions, skip, 0.5) == expected
+    with mock.patch("safe_autonomy_sims.utils._HAS_NUMBA", False):
+        assert any_collision(positions, skip, 0.5) == expected
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("positions,skip", collision_cases)
+@pytest.mark.parametrize("safety_constraint", [0.5, 2.0, 4.0])
+def test_any_collision(positions, skip, safety_constraint):
+    """
+    Test the numba kernel, scalar and kd-tree paths of any_collision against a brute force reference
+    """
+    expected = reference_any_collision(positions, skip, safety_constraint)
+    assert _any_collision_sq_loop(positions, skip, safety_constraint**2) == expected
+    assert any_collision(positions, skip, safety_constraint) == expected
+    with mock.patch("safe_autonomy_sims.utils._HAS_NUMBA", False):
+        assert any_collision(positions, skip, safety_constraint) == expected
+
+
+@pytest.mark.unit_test
+def test_any_collision_is_strict():
+    """
+    Test that positions exactly safety_constraint apart do not collide
+    """
+    # evenly spaced along x, enough points to take the kd-tree path
+    positions = np.zeros((10, 3))
+    positions[:, 0] = np.arange(10)
+    skip = np.zeros(10, dtype=bool)
+    assert not any_collision(positions, skip, 1.0)
+    assert not any_collision(positions[:2], skip[:2], 1.0)
+    with mock.patch("safe_autonomy_sims.utils._HAS_NUMBA", False):
+        assert not any_collision(positions, skip, 1.0)
+        assert not any_collision(positions[:2], skip[:2], 1.0)
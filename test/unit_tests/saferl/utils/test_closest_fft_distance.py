@@ -0,0 +1,91 @@
+"""
+# -------------------------------------------------------------------------------
+# Air Force Research Laboratory (AFRL) Autonomous Capabilities Team (ACT3)
+# Reinforcement Learning Core (CoRL) Runtime Assurance Extensions
+#
+# This is a US Government Work not subject to copyright protection in the US.
+#
+# The use, dissemination or disclosure of data in this file is subject to
+# limitation or restriction. See accompanying README and LICENSE for details.
+# -------------------------------------------------------------------------------
+
+This module holds unit tests for the closest Free Flight Trajectory (FFT) distance utils.
+"""
+
+import numpy as np
+import pytest
+
+from safe_autonomy_sims.utils import (
+    _closest_fft_distance_sq_loop,
+    _closest_fft_distance_sq_vectorized,
+    get_closest_fft_distance,
+    get_closest_fft_distance_sq_cached,
+)
+
+MEAN_MOTION = 0.001027
+FFT_TIMES = np.arange(0, 2 * np.pi / MEAN_MOTION, 1.0)
+
+
+def reference_closest_fft_distance(state, n, time_array):
+    """
+    Per-sample closed form CWH propagation used as ground truth
+    """
+    distances = []
+    for t in time_array:
+        x = (4 - 3 * np.cos(n * t)) * state[0] + np.sin(n * t) * state[3] / n + 2 / n * (1 - np.cos(n * t)) * state[4]
+        y = 6 * (np.sin(n * t) - n * t) * state[0] + state[1] - 2 / n * (1 - np.cos(n * t)) * state[3] + (4 * np.sin(n * t) -
+                                                                                                          3 * n * t) * state[4] / n
+        z = state[2] * np.cos(n * t) + state[5] / n * np.sin(n * t)
+        distances.append(np.linalg.norm([x, y, z]))
+    return float(min(distances))
+
+
+fft_states = [
+    np.array([10., 0., 0., 0., 0., 0.]),
+    np.array([0., 50., 0., 0., 0., 0.]),
+    np.array([20., -30., 5., 0.1, -0.05, 0.02]),
+    np.array([-80., 10., -40., -0.3, 0.2, 0.1]),
+]
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("state", fft_states)
+def test_get_closest_fft_distance(state):
+    """
+    Test get_closest_fft_distance against the per-sample reference implementation
+    """
+    expected = reference_closest_fft_distance(state, MEAN_MOTION, FFT_TIMES)
+    assert np.isclose(get_closest_fft_distance(state, MEAN_MOTION, FFT_TIMES), expected)
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("state", fft_states)
+def test_get_closest_fft_distance_sq_cached(state):
+    """
+    Test that the squared FFT distance matches the square of the reference distance
+    """
+    expected = reference_closest_fft_distance(state, MEAN_MOTION, FFT_TIMES)**2
+    sin_nt = np.sin(MEAN_MOTION * FFT_TIMES)
+    cos_nt = np.cos(MEAN_MOTION * FFT_TIMES)
+    assert np.isclose(get_closest_fft_distance_sq_cached(state, MEAN_MOTION, FFT_TIMES, sin_nt, cos_nt), expected)
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("state", fft_states)
+def test_closest_fft_distance_kernels_agree(state):
+    """
+    Test that the loop (numba) and vectorized FFT kernels return the same squared distance
+    """
+    sin_nt = np.sin(MEAN_MOTION * FFT_TIMES)
+    cos_nt = np.cos(MEAN_MOTION * FFT_TIMES)
+    args = (*state, MEAN_MOTION, FFT_TIMES, sin_nt, cos_nt)
+    assert np.isclose(_closest_fft_distance_sq_loop(*args), _closest_fft_distance_sq_vectorized(*args))
+
+
+@pytest.mark.unit_test
+def test_get_closest_fft_distance_empty_time_array():
+    """
+    Test that an empty FFT time horizon raises instead of returning a sentinel distance
+    """
+    with pytest.raises(ValueError):
+        get_closest_fft_distance(fft_states[0], MEAN_MOTION, [])
@@ -0,0 +1,38 @@
+"""
+# -------------------------------------------------------------------------------
+# Air Force Research Laboratory (AFRL) Autonomous Capabilities Team (ACT3)
+# Reinforcement Learning Core (CoRL) Runtime Assurance Extensions
+#
+# This is a US Government Work not subject to copyright protection in the US.
+#
+# The use, dissemination or disclosure of data in this file is subject to
+# limitation or restriction. See accompanying README and LICENSE for details.
+# -------------------------------------------------------------------------------
+
+This module holds unit tests for get_relative_position.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from safe_autonomy_sims.utils import get_relative_position
+
+
+@pytest.mark.unit_test
+def test_get_relative_position_out():
+    """
+    Test that get_relative_position writes into a provided output buffer
+    """
+    platform = mock.Mock(position=[10.0, 20.0, 30.0])
+    sensor = mock.Mock()
+    sensor.get_measurement.return_value = SimpleNamespace(m=np.array([1.0, 2.0, 3.0], dtype=np.float32))
+    out = np.empty(3)
+
+    with mock.patch("safe_autonomy_sims.utils.get_sensor_by_name", return_value=sensor):
+        relative_position = get_relative_position(platform, "reference_position", out=out)
+        assert relative_position is out
+        assert np.array_equal(out, [9.0, 18.0, 27.0])
+        assert np.array_equal(get_relative_position(platform, "reference_position"), [9.0, 18.0, 27.0])
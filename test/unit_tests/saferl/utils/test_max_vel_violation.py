@@ -0,0 +1,45 @@
+"""
+# -------------------------------------------------------------------------------
+# Air Force Research Laboratory (AFRL) Autonomous Capabilities Team (ACT3)
+# Reinforcement Learning Core (CoRL) Runtime Assurance Extensions
+#
+# This is a US Government Work not subject to copyright protection in the US.
+#
+# The use, dissemination or disclosure of data in this file is subject to
+# limitation or restriction. See accompanying README and LICENSE for details.
+# -------------------------------------------------------------------------------
+
+This module holds unit tests for max_vel_violation.
+"""
+
+import numpy as np
+import pytest
+
+from safe_autonomy_sims.utils import max_vel_violation
+
+MEAN_MOTION = 0.001027
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("lower_bound", [False, True])
+@pytest.mark.parametrize(
+    "relative_position,relative_velocity",
+    [
+        (np.array([10.0, -20.0, 5.0]), np.array([0.1, 0.2, -0.3])),
+        (np.array([1000.0, 0.0, 0.0]), np.array([3.0, 1.0, 0.0])),
+        ([0.5, 0.0, 0.0], [0.1, 0.0, 0.0]),
+    ],
+)
+def test_max_vel_violation(relative_position, relative_velocity, lower_bound):
+    """
+    Test max_vel_violation against the velocity limit computed from numpy norms
+    """
+    distance = np.linalg.norm(relative_position)
+    speed = np.linalg.norm(relative_velocity)
+    vel_limit = 0.2 + 2.0 * MEAN_MOTION * max(distance - 1.0, 0.0)
+    expected_violation = (vel_limit - speed) if lower_bound else (speed - vel_limit)
+    expected_violated = (speed < vel_limit) if lower_bound else (speed > vel_limit)
+
+    violated, violation = max_vel_violation(relative_position, relative_velocity, 0.2, 1.0, MEAN_MOTION, lower_bound)
+    assert violated == expected_violated
+    assert np.isclose(violation, expected_violation)
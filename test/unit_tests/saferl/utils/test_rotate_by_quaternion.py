@@ -0,0 +1,39 @@
+"""
+# -------------------------------------------------------------------------------
+# Air Force Research Laboratory (AFRL) Autonomous Capabilities Team (ACT3)
+# Reinforcement Learning Core (CoRL) Runtime Assurance Extensions
+#
+# This is a US Government Work not subject to copyright protection in the US.
+#
+# The use, dissemination or disclosure of data in this file is subject to
+# limitation or restriction. See accompanying README and LICENSE for details.
+# -------------------------------------------------------------------------------
+
+This module holds unit tests for rotate_by_quaternion.
+"""
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation
+
+from safe_autonomy_sims.utils import rotate_by_quaternion
+
+
+quaternions = [
+    np.array([0., 0., 0., 1.]),
+    np.array([0., 0., np.sin(np.pi / 4), np.cos(np.pi / 4)]),
+    np.array([0.1, -0.4, 0.3, 0.8]),
+    np.array([-0.5, 0.5, 0.5, -0.5]),
+]
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("quaternion", quaternions)
+def test_rotate_by_quaternion(quaternion):
+    """
+    Test rotate_by_quaternion against scipy for single vectors and stacks of vectors
+    """
+    vectors = np.array([[1., 0., 0.], [0., 1., 0.], [0., 0., 1.], [3., -2., 0.5]])
+    expected = Rotation.from_quat(quaternion).apply(vectors)
+    assert np.allclose(rotate_by_quaternion(quaternion, vectors), expected)
+    assert np.allclose(rotate_by_quaternion(quaternion, vectors[3]), expected[3])
@@ -0,0 +1,36 @@
+"""
+# -------------------------------------------------------------------------------
+# Air Force Research Laboratory (AFRL) Autonomous Capabilities Team (ACT3)
+# Reinforcement Learning Core (CoRL) Runtime Assurance Extensions
+#
+# This is a US Government Work not subject to copyright protection in the US.
+#
+# The use, dissemination or disclosure of data in this file is subject to
+# limitation or restriction. See accompanying README and LICENSE for details.
+# -------------------------------------------------------------------------------
+
+This module holds unit tests for shallow_dict_merge.
+"""
+
+import pytest
+
+from safe_autonomy_sims.utils import KeyCollisionError, shallow_dict_merge
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("in_place", [False, True])
+def test_shallow_dict_merge(in_place):
+    """
+    Test that shallow_dict_merge prefers a's values, keeps key order and raises on disallowed collisions
+    """
+    a = {"x": 1, "y": 2}
+    b = {"z": 3, "x": 10, "w": 4}
+
+    output = shallow_dict_merge(a, b, in_place=in_place)
+    assert output == {"x": 1, "y": 2, "z": 3, "w": 4}
+    assert list(output) == ["x", "y", "z", "w"]
+    assert (output is a) == in_place
+
+    with pytest.raises(KeyCollisionError):
+        shallow_dict_merge({"x": 1}, {"x": 2}, in_place=in_place, allow_collisions=False)
+    assert shallow_dict_merge({"x": 1}, {"y": 2}, in_place=in_place, allow_collisions=False) == {"x": 1, "y": 2}